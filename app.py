@@ -5,28 +5,74 @@ It sets up the Flask app, configures CORS and the database, and defines all
 the RESTful API endpoints for managing tasks, events, and journal entries.
 The endpoints support standard CRUD (Create, Read, Update, Delete) operations.
 """
+import functools
+import hashlib
+import itertools
 import uuid
 from datetime import datetime, timezone, timedelta
-from flask import Flask, jsonify, request
+
+import ciso8601
+import orjson
+from flask import Flask, Response, abort, jsonify, request, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+from flask_caching import Cache
 from flask_cors import CORS
 from flask_migrate import Migrate
 
 from config import Config
 from models import db, Task, Event, JournalEntry
 
+# Encode naive datetimes as UTC with a trailing 'Z', everywhere orjson is used.
+_ORJSON_OPTS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider that encodes and decodes with orjson.
+
+    orjson's compiled encoder is several times faster than the stdlib json
+    module used by Flask's default provider, and it serializes datetime and
+    date objects natively. Naive datetimes are treated as UTC and rendered
+    with a trailing 'Z'. Decoding goes through orjson as well, so request
+    bodies (request.json) are parsed by the same compiled code path.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=_ORJSON_OPTS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
 app.config.from_object(Config)
+app.json = ORJSONProvider(app)
 CORS(app)
+# Response cache for the list endpoints. SimpleCache is per-process; use
+# CACHE_TYPE='RedisCache' when deploying with multiple worker processes.
+cache = Cache(app, config={'CACHE_TYPE': 'SimpleCache', 'CACHE_DEFAULT_TIMEOUT': 60})
 db.init_app(app)
 migrate = Migrate(app, db)
 
 
+# Recurrence periods, hoisted to module scope so the POST /tasks hot path does
+# a single dict lookup instead of rebuilding the table (and its timedeltas) on
+# every call. Values are (step, number of future instances).
+_RECURRENCE_PERIODS = {
+    'daily': (timedelta(days=1), 90),  # Approx 3 months
+    'weekly': (timedelta(weeks=1), 12),  # Approx 3 months
+}
+
+
 # --- Helper Functions ---
+@functools.lru_cache(maxsize=4096)
 def parse_date(date_str):
     """
     Parse a string into a date object.
 
-    Handles both ISO formats with 'Z' and 'YYYY-MM-DD' format.
+    Handles both ISO formats with 'Z' and 'YYYY-MM-DD' format. Results are
+    memoized: both parsers are pure functions of a short string with
+    immutable results, and clients tend to resend the same timestamps.
 
     Args:
         date_str (str): The date string to parse.
@@ -37,15 +83,18 @@ def parse_date(date_str):
     if not date_str:
         return None
     try:
-        return datetime.fromisoformat(date_str.replace('Z', '+00:00')).date()
+        return ciso8601.parse_datetime(date_str).date()
     except ValueError:
         return datetime.strptime(date_str, '%Y-%m-%d').date()
 
 
+@functools.lru_cache(maxsize=4096)
 def parse_datetime(datetime_str):
     """
     Parse an ISO 8601 datetime string into a datetime object.
 
+    Results are memoized; see parse_date.
+
     Args:
         datetime_str (str): The datetime string, potentially with 'Z' for UTC.
 
@@ -54,7 +103,7 @@ def parse_datetime(datetime_str):
     """
     if not datetime_str:
         return None
-    return datetime.fromisoformat(datetime_str.replace('Z', '+00:00'))
+    return ciso8601.parse_datetime(datetime_str)
 
 
 def _create_recurring_tasks(original_task):
@@ -62,7 +111,7 @@ def _create_recurring_tasks(original_task):
     Generate future instances of a recurring task.
 
     Based on the original task's recurrence_type, this function creates
-    and adds new task instances to the database session.
+    new task instances and writes them in one bulk INSERT statement.
 
     Args:
         original_task (Task): The first task in the recurring series.
@@ -70,6 +119,12 @@ def _create_recurring_tasks(original_task):
     if not original_task.is_recurring or not original_task.recurrence_type:
         return
 
+    # Bail out before any copying work when the recurrence type is unknown.
+    period = _RECURRENCE_PERIODS.get(original_task.recurrence_type)
+    if period is None:
+        return
+    delta, count = period
+
     # Use a dictionary to avoid manually copying attributes
     task_data = original_task.to_dict()
     # Remove fields that should not be copied or will be recalculated for new tasks
@@ -79,26 +134,169 @@ def _create_recurring_tasks(original_task):
     task_data.pop('time_tracked_seconds', None)
     task_data.pop('created_at', None)
 
-    # Define recurrence periods for better clarity and maintainability
-    recurrence_periods = {
-        'daily': {'delta': timedelta(days=1), 'count': 90},  # Approx 3 months
-        'weekly': {'delta': timedelta(weeks=1), 'count': 12},  # Approx 3 months
-    }
+    # Accumulate one delta per step rather than computing delta * i for
+    # every instance, which allocated a fresh timedelta each iteration.
+    due_dates = itertools.accumulate(
+        itertools.repeat(delta, count),
+        initial=original_task.due_date
+    )
+    next(due_dates)  # Skip the original task's own due date.
+    # Build the full series up front and write it with a single multi-row
+    # INSERT instead of adding (and flushing) one Task object per instance.
+    values = [{**task_data, 'due_date': due_date} for due_date in due_dates]
+    db.session.execute(db.insert(Task), values)
+
+
+def _update_row(model, row_id, values):
+    """
+    Update a single row with one UPDATE ... RETURNING statement.
+
+    This avoids the SELECT-then-UPDATE pattern of loading the ORM object
+    first: the row is modified and read back in a single round-trip.
 
-    if config := recurrence_periods.get(original_task.recurrence_type):
-        for i in range(1, config['count'] + 1):
-            new_due_date = original_task.due_date + (config['delta'] * i)
-            db.session.add(Task(**task_data, due_date=new_due_date))
+    Args:
+        model (db.Model): The mapped model class to update.
+        row_id (int): The primary key of the row to update.
+        values (dict): Column values to set; may be empty.
+
+    Returns:
+        db.Model: The updated (or, if values is empty, current) row.
+    """
+    if not values:
+        # Nothing to change; still return the current row (or a 404).
+        return model.query.get_or_404(row_id)
+
+    row = db.session.execute(
+        db.update(model).where(model.id == row_id).values(values).returning(model)
+    ).scalar_one_or_none()
+    if row is None:
+        abort(404)
+    return row
+
+
+# Dialect-specific SQL that serializes each listing directly to a JSON array
+# inside the database. This skips ORM hydration and per-row to_dict() calls on
+# the hot GET path; datetime formatting happens once in SQL instead of in Python.
+#
+# Datetimes are rendered exactly like the orjson provider (OPT_NAIVE_UTC |
+# OPT_UTC_Z) renders them elsewhere: UTC with a trailing 'Z', microseconds
+# only when non-zero. Naive columns are stored as UTC; timezone-aware columns
+# (created_at) are converted with AT TIME ZONE on Postgres so the output does
+# not depend on the session TimeZone.
+_TASKS_JSON_SQL = {
+    'postgresql': """
+        SELECT COALESCE(json_agg(json_build_object(
+            'id', id,
+            'title', title,
+            'description', description,
+            'is_recurring', is_recurring,
+            'recurrence_type', recurrence_type,
+            'is_completed', is_completed,
+            'due_date', to_char(due_date, 'YYYY-MM-DD'),
+            'start_time', replace(to_char(start_time, 'YYYY-MM-DD"T"HH24:MI:SS.US') || 'Z', '.000000Z', 'Z'),
+            'end_time', replace(to_char(end_time, 'YYYY-MM-DD"T"HH24:MI:SS.US') || 'Z', '.000000Z', 'Z'),
+            'time_tracked_seconds', time_tracked_seconds,
+            'created_at', replace(to_char(created_at AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS.US') || 'Z', '.000000Z', 'Z'),
+            'recurrence_group_id', recurrence_group_id
+        )), '[]') FROM task
+    """,
+    'sqlite': """
+        SELECT json_group_array(json_object(
+            'id', id,
+            'title', title,
+            'description', description,
+            'is_recurring', json(CASE is_recurring WHEN 1 THEN 'true' WHEN 0 THEN 'false' ELSE 'null' END),
+            'recurrence_type', recurrence_type,
+            'is_completed', json(CASE is_completed WHEN 1 THEN 'true' WHEN 0 THEN 'false' ELSE 'null' END),
+            'due_date', due_date,
+            'start_time', replace(replace(start_time, ' ', 'T') || 'Z', '.000000Z', 'Z'),
+            'end_time', replace(replace(end_time, ' ', 'T') || 'Z', '.000000Z', 'Z'),
+            'time_tracked_seconds', time_tracked_seconds,
+            'created_at', replace(replace(created_at, ' ', 'T') || 'Z', '.000000Z', 'Z'),
+            'recurrence_group_id', recurrence_group_id
+        )) FROM task
+    """,
+}
+
+_EVENTS_JSON_SQL = {
+    'postgresql': """
+        SELECT COALESCE(json_agg(json_build_object(
+            'id', id,
+            'title', title,
+            'description', description,
+            'start_time', replace(to_char(start_time, 'YYYY-MM-DD"T"HH24:MI:SS.US') || 'Z', '.000000Z', 'Z'),
+            'end_time', replace(to_char(end_time, 'YYYY-MM-DD"T"HH24:MI:SS.US') || 'Z', '.000000Z', 'Z'),
+            'created_at', replace(to_char(created_at AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS.US') || 'Z', '.000000Z', 'Z')
+        )), '[]') FROM event
+    """,
+    'sqlite': """
+        SELECT json_group_array(json_object(
+            'id', id,
+            'title', title,
+            'description', description,
+            'start_time', replace(replace(start_time, ' ', 'T') || 'Z', '.000000Z', 'Z'),
+            'end_time', replace(replace(end_time, ' ', 'T') || 'Z', '.000000Z', 'Z'),
+            'created_at', replace(replace(created_at, ' ', 'T') || 'Z', '.000000Z', 'Z')
+        )) FROM event
+    """,
+}
+
+def _json_array_response(queries):
+    """
+    Serialize a listing to JSON inside the database, if the dialect allows.
+
+    Args:
+        queries (dict): Mapping of dialect name to an aggregating SQL query
+            that returns the whole listing as a single JSON array string.
+
+    Returns:
+        Response or None: The ready-to-send JSON response, or None when the
+        active dialect has no aggregation query and the caller should fall
+        back to ORM serialization.
+    """
+    sql = queries.get(db.engine.dialect.name)
+    if sql is None:
+        return None
+    payload = db.session.execute(db.text(sql)).scalar() or '[]'
+    return Response(payload, mimetype='application/json')
+
+
+# --- Request Hooks ---
+@app.after_request
+def apply_conditional_etag(response):
+    """
+    Attach an ETag to successful GET responses and honor If-None-Match.
+
+    The ETag is a content hash of the response body. When the client sends
+    a matching If-None-Match header, the body is dropped and a 304 Not
+    Modified is returned instead, saving bandwidth on unchanged listings.
+
+    Args:
+        response (Response): The outgoing response.
+
+    Returns:
+        Response: The response, possibly converted to a 304.
+    """
+    # Streamed responses are skipped: hashing them would force the whole
+    # body to be materialized, defeating the point of streaming.
+    if request.method == 'GET' and response.status_code == 200 and not response.is_streamed:
+        etag = hashlib.blake2b(response.get_data(), digest_size=16).hexdigest()
+        response.set_etag(etag)
+        response.make_conditional(request)
+    return response
 
 
 # --- API Endpoints ---
 @app.route('/tasks', methods=['GET'])
+@cache.cached(key_prefix='tasks_all')
 def get_tasks():
     """Retrieve a list of all tasks.
 
     Returns:
         Response: A JSON response containing a list of task objects.
     """
+    if (response := _json_array_response(_TASKS_JSON_SQL)) is not None:
+        return response
     tasks = Task.query.all()
     return jsonify([task.to_dict() for task in tasks])
 
@@ -127,29 +325,81 @@ def create_task():
     is_recurring = data.get('is_recurring', False)
     recurrence_group_id = str(uuid.uuid4()) if is_recurring else None
 
-    # Create the main task object
-    new_task = Task(
-        title=data.get('title'),
-        description=data.get('description'),
-        is_recurring=is_recurring,
-        recurrence_type=data.get('recurrence_type'),
-        recurrence_group_id=recurrence_group_id,
-        due_date=due_date,
-        start_time=parse_datetime(data.get('start_time')),
-        end_time=parse_datetime(data.get('end_time'))
-    )
-    db.session.add(new_task)
-
-    # Flush the session to the database. This populates new_task with db-generated
-    # values like 'id' and 'created_at' before we use it.
-    db.session.flush()
+    # Insert the main task with RETURNING so the db-generated values like
+    # 'id' and 'created_at' come back in the same round-trip, instead of an
+    # add() followed by a separate flush.
+    new_task = db.session.execute(
+        db.insert(Task).values(
+            title=data.get('title'),
+            description=data.get('description'),
+            is_recurring=is_recurring,
+            recurrence_type=data.get('recurrence_type'),
+            recurrence_group_id=recurrence_group_id,
+            due_date=due_date,
+            start_time=parse_datetime(data.get('start_time')),
+            end_time=parse_datetime(data.get('end_time'))
+        ).returning(Task)
+    ).scalar_one()
 
     # If the task is recurring, generate the future instances.
     _create_recurring_tasks(new_task)
     db.session.commit()
+    cache.delete('tasks_all')
     return jsonify(new_task.to_dict()), 201
 
 
+@app.route('/tasks:batch', methods=['POST'])
+def create_tasks_batch():
+    """
+    Create several tasks from a single JSON payload.
+
+    All rows are validated first and then written with one bulk INSERT, so a
+    client importing N tasks pays one HTTP round-trip and one SQL statement
+    instead of N of each.
+
+    Request Body (JSON):
+        - tasks (list): A list of task objects, each with the same fields as
+          the single-task POST endpoint.
+
+    Returns:
+        Response: The list of created task objects with a 201 status code,
+        or an error with a 400 status.
+    """
+    data = request.json
+    items = data.get('tasks')
+    if not isinstance(items, list) or not items:
+        return jsonify({'error': 'tasks must be a non-empty list'}), 400
+
+    values = []
+    for index, item in enumerate(items):
+        due_date = parse_date(item.get('due_date'))
+        if not item.get('title') or not due_date:
+            return jsonify({'error': f'tasks[{index}]: title and due_date are required'}), 400
+        is_recurring = item.get('is_recurring', False)
+        values.append({
+            'title': item.get('title'),
+            'description': item.get('description'),
+            'is_recurring': is_recurring,
+            'recurrence_type': item.get('recurrence_type'),
+            'recurrence_group_id': str(uuid.uuid4()) if is_recurring else None,
+            'due_date': due_date,
+            'start_time': parse_datetime(item.get('start_time')),
+            'end_time': parse_datetime(item.get('end_time'))
+        })
+
+    tasks = db.session.execute(
+        db.insert(Task).returning(Task, sort_by_parameter_order=True), values
+    ).scalars().all()
+    # Fan out future instances for any recurring rows; each series is still
+    # a single bulk INSERT. Only the parent tasks are returned, matching the
+    # single-task endpoint.
+    for task in tasks:
+        _create_recurring_tasks(task)
+    db.session.commit()
+    cache.delete('tasks_all')
+    return jsonify([task.to_dict() for task in tasks]), 201
+
+
 @app.route('/tasks/<int:task_id>', methods=['PUT'])
 def update_task(task_id):
     """Update an existing task's details from a JSON payload.
@@ -163,13 +413,16 @@ def update_task(task_id):
     Returns:
         Response: The updated task object.
     """
-    task = Task.query.get_or_404(task_id)
     data = request.json
-    task.title = data.get('title', task.title)
-    task.description = data.get('description', task.description)
-    task.is_completed = data.get('is_completed', task.is_completed)
-    task.time_tracked_seconds = data.get('time_tracked_seconds', task.time_tracked_seconds)
+    # Only copy over the mutable fields that the client actually sent.
+    values = {
+        key: data[key]
+        for key in ('title', 'description', 'is_completed', 'time_tracked_seconds')
+        if key in data
+    }
+    task = _update_row(Task, task_id, values)
     db.session.commit()
+    cache.delete('tasks_all')
     return jsonify(task.to_dict())
 
 
@@ -201,16 +454,20 @@ def delete_task(task_id):
         db.session.delete(task)
 
     db.session.commit()
+    cache.delete('tasks_all')
     return '', 204
 
 
 @app.route('/events', methods=['GET'])
+@cache.cached(key_prefix='events_all')
 def get_events():
     """Retrieve a list of all events.
 
     Returns:
         Response: A JSON response containing a list of event objects.
     """
+    if (response := _json_array_response(_EVENTS_JSON_SQL)) is not None:
+        return response
     return jsonify([event.to_dict() for event in Event.query.all()])
 
 
@@ -238,9 +495,51 @@ def create_event():
     )
     db.session.add(new_event)
     db.session.commit()
+    cache.delete('events_all')
     return jsonify(new_event.to_dict()), 201
 
 
+@app.route('/events:batch', methods=['POST'])
+def create_events_batch():
+    """
+    Create several events from a single JSON payload.
+
+    See create_tasks_batch; validation happens up front and all rows go out
+    in one bulk INSERT.
+
+    Request Body (JSON):
+        - events (list): A list of event objects, each with the same fields
+          as the single-event POST endpoint.
+
+    Returns:
+        Response: The list of created event objects with a 201 status code,
+        or an error with a 400 status.
+    """
+    data = request.json
+    items = data.get('events')
+    if not isinstance(items, list) or not items:
+        return jsonify({'error': 'events must be a non-empty list'}), 400
+
+    values = []
+    for index, item in enumerate(items):
+        start_time = parse_datetime(item.get('start_time'))
+        if not item.get('title') or not start_time:
+            return jsonify({'error': f'events[{index}]: title and start_time are required'}), 400
+        values.append({
+            'title': item.get('title'),
+            'description': item.get('description'),
+            'start_time': start_time,
+            'end_time': parse_datetime(item.get('end_time'))
+        })
+
+    events = db.session.execute(
+        db.insert(Event).returning(Event, sort_by_parameter_order=True), values
+    ).scalars().all()
+    db.session.commit()
+    cache.delete('events_all')
+    return jsonify([event.to_dict() for event in events]), 201
+
+
 @app.route('/events/<int:event_id>', methods=['PUT'])
 def update_event(event_id):
     """Update an existing event's details from a JSON payload.
@@ -254,25 +553,25 @@ def update_event(event_id):
     Returns:
         Response: The updated event object.
     """
-    event = Event.query.get_or_404(event_id)
     data = request.json
 
     # Standard updates for simple fields
-    event.title = data.get('title', event.title)
-    event.description = data.get('description', event.description)
+    values = {key: data[key] for key in ('title', 'description') if key in data}
 
     # Update start_time only if a valid (non-null) value is provided,
     # as this field is required in the database.
     new_start_time = parse_datetime(data.get('start_time'))
     if new_start_time:
-        event.start_time = new_start_time
+        values['start_time'] = new_start_time
 
     # For nullable fields like end_time, checking for the key's presence
     # allows clients to explicitly set the value to null.
     if 'end_time' in data:
-        event.end_time = parse_datetime(data.get('end_time'))
+        values['end_time'] = parse_datetime(data.get('end_time'))
 
+    event = _update_row(Event, event_id, values)
     db.session.commit()
+    cache.delete('events_all')
     return jsonify(event.to_dict())
 
 
@@ -289,17 +588,86 @@ def delete_event(event_id):
     event = Event.query.get_or_404(event_id)
     db.session.delete(event)
     db.session.commit()
+    cache.delete('events_all')
     return '', 204
 
 
 @app.route('/journal', methods=['GET'])
 def get_journal_entries():
-    """Retrieve all journal entries, ordered by the most recent first.
+    """Retrieve journal entries, ordered by the most recent first.
+
+    When 'before' or 'limit' query parameters are given, a page of entries
+    is returned together with a cursor for the next page, so each request
+    reads only a bounded slice of the (descending) timestamp index. Without
+    them, the full listing is streamed entry by entry: rows are fetched in
+    batches of 500 (server-side cursor on Postgres) and encoded as they
+    arrive, so peak memory and time-to-first-byte stay constant as the
+    table grows.
+
+    Query Parameters:
+        - before (str, optional): Opaque cursor from the previous page's
+          next_cursor ('<timestamp>,<id>'); entries strictly older than it
+          are returned. A bare ISO timestamp is also accepted.
+        - limit (int, optional): Page size, clamped to 1..500; defaults
+          to 50.
 
     Returns:
-        Response: A JSON response containing a list of journal entry objects.
+        Response: A JSON object with 'items' and 'next_cursor' when
+        paginating, or a streamed JSON list of all entries otherwise.
     """
-    return jsonify([entry.to_dict() for entry in JournalEntry.query.order_by(JournalEntry.timestamp.desc()).all()])
+    before = request.args.get('before')
+    limit = request.args.get('limit', type=int)
+    if before or limit:
+        limit = min(max(limit or 50, 1), 500)
+        # Ordering by (timestamp DESC, id DESC) gives a stable order when
+        # timestamps collide and resolves as a range scan on the descending
+        # timestamp index.
+        query = db.select(JournalEntry).order_by(
+            JournalEntry.timestamp.desc(), JournalEntry.id.desc()
+        ).limit(limit)
+        if before:
+            raw_ts, _, raw_id = before.partition(',')
+            try:
+                before_ts = parse_datetime(raw_ts)
+                before_id = int(raw_id) if raw_id else None
+            except ValueError:
+                before_ts = None
+            if before_ts is None:
+                return jsonify({'error': 'before must be a next_cursor value or ISO timestamp'}), 400
+            if before_id is not None:
+                # Compound comparison so entries sharing the cursor's
+                # timestamp but with smaller ids are still reachable.
+                query = query.where(db.or_(
+                    JournalEntry.timestamp < before_ts,
+                    db.and_(JournalEntry.timestamp == before_ts,
+                            JournalEntry.id < before_id)
+                ))
+            else:
+                query = query.where(JournalEntry.timestamp < before_ts)
+        items = db.session.execute(query).scalars().all()
+        next_cursor = None
+        if len(items) == limit:
+            last = items[-1]
+            next_cursor = f'{last.timestamp.isoformat()},{last.id}'
+        return jsonify({
+            'items': [entry.to_dict() for entry in items],
+            'next_cursor': next_cursor
+        })
+
+    def generate():
+        entries = db.session.execute(
+            db.select(JournalEntry)
+            .order_by(JournalEntry.timestamp.desc())
+            .execution_options(yield_per=500)
+        ).scalars()
+        yield '['
+        for index, entry in enumerate(entries):
+            if index:
+                yield ','
+            yield orjson.dumps(entry.to_dict(), option=_ORJSON_OPTS).decode()
+        yield ']'
+
+    return Response(stream_with_context(generate()), mimetype='application/json')
 
 
 @app.route('/journal', methods=['POST'])
@@ -319,15 +687,55 @@ def create_journal_entry():
 
     new_entry = JournalEntry(
         entry_type=data.get('entry_type'),
-        content=data.get('content'),
-        # Use the provided timestamp or default to now.
-        timestamp=parse_datetime(data.get('timestamp')) or datetime.now(timezone.utc)
+        content=data.get('content')
     )
+    # Use the provided timestamp; otherwise the database default applies.
+    if timestamp := parse_datetime(data.get('timestamp')):
+        new_entry.timestamp = timestamp
     db.session.add(new_entry)
     db.session.commit()
     return jsonify(new_entry.to_dict()), 201
 
 
+@app.route('/journal:batch', methods=['POST'])
+def create_journal_entries_batch():
+    """
+    Create several journal entries from a single JSON payload.
+
+    See create_tasks_batch; validation happens up front and all rows go out
+    in one bulk INSERT.
+
+    Request Body (JSON):
+        - entries (list): A list of journal entry objects, each with the
+          same fields as the single-entry POST endpoint.
+
+    Returns:
+        Response: The list of created entry objects with a 201 status code,
+        or an error with a 400 status.
+    """
+    data = request.json
+    items = data.get('entries')
+    if not isinstance(items, list) or not items:
+        return jsonify({'error': 'entries must be a non-empty list'}), 400
+
+    values = []
+    for index, item in enumerate(items):
+        if not item.get('entry_type') or not item.get('content'):
+            return jsonify({'error': f'entries[{index}]: entry_type and content are required'}), 400
+        values.append({
+            'entry_type': item.get('entry_type'),
+            'content': item.get('content'),
+            # Use the provided timestamp or default to now.
+            'timestamp': parse_datetime(item.get('timestamp')) or datetime.now(timezone.utc)
+        })
+
+    entries = db.session.execute(
+        db.insert(JournalEntry).returning(JournalEntry, sort_by_parameter_order=True), values
+    ).scalars().all()
+    db.session.commit()
+    return jsonify([entry.to_dict() for entry in entries]), 201
+
+
 @app.route('/journal/<int:entry_id>', methods=['PUT'])
 def update_journal_entry(entry_id):
     """Update an existing journal entry from a JSON payload.
@@ -342,18 +750,20 @@ def update_journal_entry(entry_id):
     Returns:
         Response: The updated journal entry object.
     """
-    entry = JournalEntry.query.get_or_404(entry_id)
     data = request.json
 
     # Update the main content field
-    entry.content = data.get('content', entry.content)
+    values = {}
+    if 'content' in data:
+        values['content'] = data['content']
 
     # Update timestamp only if a valid (non-null) value is provided,
     # as this field is required in the database.
     new_timestamp = parse_datetime(data.get('timestamp'))
     if new_timestamp:
-        entry.timestamp = new_timestamp
+        values['timestamp'] = new_timestamp
 
+    entry = _update_row(JournalEntry, entry_id, values)
     db.session.commit()
     return jsonify(entry.to_dict())
 
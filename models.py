@@ -6,11 +6,13 @@ It includes the following models:
 - Event: Represents a scheduled event with a start and end time.
 - JournalEntry: Represents a generic log entry for things like meals or moods.
 """
-from datetime import datetime, timezone
 from flask_sqlalchemy import SQLAlchemy
 
 
-db = SQLAlchemy()
+# Keep committed objects readable without a refresh: every handler returns
+# attribute values it already holds, so post-commit expiry would only add a
+# re-SELECT per mutating request.
+db = SQLAlchemy(session_options={'expire_on_commit': False})
 
 
 class Task(db.Model):
@@ -25,13 +27,24 @@ class Task(db.Model):
     start_time = db.Column(db.DateTime, nullable=True)
     end_time = db.Column(db.DateTime, nullable=True)
     time_tracked_seconds = db.Column(db.Integer, default=0)
-    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+    # Computed by the database, so inserts need no per-row Python default.
+    created_at = db.Column(db.DateTime(timezone=True), server_default=db.func.now(), nullable=False)
     recurrence_type = db.Column(db.String(50), nullable=True)  # e.g., 'daily', 'weekly'
     # A unique ID to group recurring tasks together.
     recurrence_group_id = db.Column(db.String(36), nullable=True, index=True)
 
+    # Composite index so "delete all future instances" resolves as an index
+    # range scan on (group, due_date) instead of filtering the whole group.
+    __table_args__ = (
+        db.Index('ix_task_group_due', 'recurrence_group_id', 'due_date'),
+    )
+
     def to_dict(self):
-        """Return a dictionary representation of the Task object."""
+        """Return a dictionary representation of the Task object.
+
+        Date and datetime fields are returned as raw objects; the app's
+        orjson provider renders them as ISO 8601 during response encoding.
+        """
         return {
             'id': self.id,
             'title': self.title,
@@ -39,11 +52,11 @@ class Task(db.Model):
             'is_recurring': self.is_recurring,
             'recurrence_type': self.recurrence_type,
             'is_completed': self.is_completed,
-            'due_date': self.due_date.isoformat() if self.due_date else None,
-            'start_time': self.start_time.isoformat() if self.start_time else None,
-            'end_time': self.end_time.isoformat() if self.end_time else None,
+            'due_date': self.due_date,
+            'start_time': self.start_time,
+            'end_time': self.end_time,
             'time_tracked_seconds': self.time_tracked_seconds,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'created_at': self.created_at,
             'recurrence_group_id': self.recurrence_group_id
         }
 
@@ -56,17 +69,22 @@ class Event(db.Model):
     description = db.Column(db.Text, nullable=True)
     start_time = db.Column(db.DateTime, nullable=False)
     end_time = db.Column(db.DateTime, nullable=True)  # Events can have a start time without a defined end time.
-    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+    # Computed by the database, so inserts need no per-row Python default.
+    created_at = db.Column(db.DateTime(timezone=True), server_default=db.func.now(), nullable=False)
 
     def to_dict(self):
-        """Return a dictionary representation of the Event object."""
+        """Return a dictionary representation of the Event object.
+
+        Datetime fields are returned as raw objects; the app's orjson
+        provider renders them as ISO 8601 during response encoding.
+        """
         return {
             'id': self.id,
             'title': self.title,
             'description': self.description,
-            'start_time': self.start_time.isoformat(),
-            'end_time': self.end_time.isoformat() if self.end_time else None,  # Gracefully handle nullable end_time.
-            'created_at': self.created_at.isoformat() if self.created_at else None
+            'start_time': self.start_time,
+            'end_time': self.end_time,
+            'created_at': self.created_at
         }
 
 
@@ -76,13 +94,24 @@ class JournalEntry(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     entry_type = db.Column(db.String(50), nullable=False)  # 'meal', 'sleep', 'mood'
     content = db.Column(db.JSON, nullable=False)
-    timestamp = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+    # Computed by the database when the client does not supply a timestamp.
+    timestamp = db.Column(db.DateTime(timezone=True), server_default=db.func.now(), nullable=False)
+
+    # Descending index so the "most recent first" listing reads straight off
+    # the index instead of sorting the whole table per request.
+    __table_args__ = (
+        db.Index('ix_journal_timestamp_desc', timestamp.desc()),
+    )
 
     def to_dict(self):
-        """Return a dictionary representation of the JournalEntry object."""
+        """Return a dictionary representation of the JournalEntry object.
+
+        The timestamp is returned as a raw datetime; the app's orjson
+        provider renders it as ISO 8601 during response encoding.
+        """
         return {
             'id': self.id,
             'entry_type': self.entry_type,
             'content': self.content,
-            'timestamp': self.timestamp.isoformat()
+            'timestamp': self.timestamp
         }
@@ -0,0 +1,23 @@
+"""
+Gunicorn entry point for the Personal Planner.
+
+gevent's monkey-patching must run before Flask, SQLAlchemy, or the database
+driver are imported so that their blocking socket calls become cooperative.
+Every endpoint in this app is IO-bound (SQL plus JSON encoding), so gevent
+workers let one process serve many concurrent requests. Start with:
+
+    gunicorn -k gevent -w 4 --worker-connections 1000 wsgi:app
+"""
+from gevent import monkey
+
+monkey.patch_all()
+
+try:
+    # Make psycopg2's C-level socket waits cooperative under gevent as well.
+    from psycogreen.gevent import patch_psycopg
+    patch_psycopg()
+except ImportError:
+    # psycopg2/psycogreen are only installed for Postgres deployments.
+    pass
+
+from app import app  # noqa: E402  Import must happen after monkey-patching.